@@ -4,19 +4,28 @@
 Python Qt6 interface for controlling Arduino-based 6DOF robot arm
 """
 
+import os
 import sys
+import re
+import queue
 import json
 import time
+import struct
+from collections import deque
+from functools import partial
 import serial
 import serial.tools.list_ports
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QSlider, QPushButton, QGroupBox, QTextEdit, QComboBox,
+    QLabel, QSlider, QPushButton, QGroupBox, QPlainTextEdit, QComboBox,
     QMessageBox, QGridLayout, QFrame, QFileDialog, QListWidget,
     QLineEdit, QSpinBox, QShortcut
 )
-from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal
-from PyQt6.QtGui import QFont, QPalette, QColor, QKeySequence, QTextCursor
+from PyQt6.QtCore import (
+    Qt, QEvent, QTimer, QThread, QMutex, QMutexLocker, QSignalBlocker,
+    pyqtSignal, pyqtSlot
+)
+from PyQt6.QtGui import QFont, QPalette, QColor, QKeySequence
 
 
 JOINT_NAMES = [
@@ -27,14 +36,115 @@ JOINT_LIMITS = [(0, 180), (30, 150), (0, 180), (0, 180), (0, 180), (90, 180)]
 HOME_POSITIONS = [92, 85, 45, 108, 80, 152]
 NUM_JOINTS = 6
 MAX_SEQUENCES = 2
-SLIDER_DEBOUNCE_MS = 80
+SLIDER_SEND_INTERVAL_MS = 40
+DEFAULT_MOVE_SPEED_MS = 15  # firmware's DEFAULT_MOVE_SPEED
+# Slack on top of the firmware's stepping time before a missing reply is
+# given up on
+SLIDER_REPLY_MARGIN_MS = 500
 RECONNECT_CHECK_MS = 3000
-STATUS_POLL_MS = 1000
+SERIAL_RX_BUFFER_LIMIT = 4096
+# cancel_read() only interrupts a read already in progress on Windows, so
+# there a short timeout backs up the wakeup; POSIX uses a self-pipe.
+SERIAL_READ_TIMEOUT_S = None if os.name == "posix" else 0.1
+# Linux serial_struct ioctls; ASYNC_LOW_LATENCY drops the USB-serial
+# driver's latency timer (16 ms on FTDI) so short replies aren't held back.
+TIOCGSERIAL = 0x541E
+TIOCSSERIAL = 0x541F
+ASYNC_LOW_LATENCY = 0x2000
 MAX_LOG_LINES = 200
+LOG_FLUSH_MS = 100
+LOG_TIME_FORMAT = "%H:%M:%S"
+PRESETS = [("Home", "HOME"), ("Min", "MIN"), ("Max", "MAX"), ("Wave", "WAVE")]
+# Pre-encoded so a preset click is one dict lookup and one queued write
+PRESET_FRAMES = {cmd: f"{cmd}\n".encode() for _, cmd in PRESETS}
+EMERGENCY_STYLE = (
+    "QPushButton { background-color: #c0392b; color: white; font-weight: bold; font-size: 13px; padding: 6px; }"
+)
+EMERGENCY_ACTIVE_STYLE = (
+    "QPushButton { background-color: #7b241c; color: white; font-weight: bold; font-size: 13px; padding: 6px; }"
+)
+EMERGENCY_FLASH_MS = 1500
+
+_strftime = time.strftime
+_localtime = time.localtime
+_J_PREFIX = tuple(b"J%d=" % (i + 1) for i in range(NUM_JOINTS))
+_OK_RE = re.compile(rb"J([1-%d]):(-?\d+)" % NUM_JOINTS)
+
+
+def _is_sequence_entry(data):
+    parts = data.split(b":", 1)
+    return len(parts) == 2 and parts[0].isdigit() and len(parts[1]) > 0
+
+
+def clamp_angle(idx, angle):
+    lo, hi = JOINT_LIMITS[idx]
+    return min(max(angle, lo), hi)
+
+
+def _parse_positions(data):
+    # Reported angles are shown as-is; the firmware enforces the limits, and
+    # clamping here would hide a GUI/firmware limits mismatch.
+    return [(int(j) - 1, int(a)) for j, a in _OK_RE.findall(data)]
+
+
+def _file_positions(entries):
+    if not isinstance(entries, dict):
+        raise ValueError("positions must be a mapping of joint to angle")
+    positions = []
+    for key, angle in entries.items():
+        idx = int(key.lstrip("J")) - 1
+        if not 0 <= idx < NUM_JOINTS:
+            raise ValueError(f"Unknown joint: {key}")
+        if isinstance(angle, bool) or not isinstance(angle, int):
+            raise ValueError(f"Angle for {key} must be an integer, got {angle!r}")
+        positions.append((idx, angle))
+    return positions
+
+
+def _set_low_latency(conn):
+    if not sys.platform.startswith("linux"):
+        return
+    import fcntl
+    buf = bytearray(128)  # larger than struct serial_struct
+    try:
+        fcntl.ioctl(conn.fileno(), TIOCGSERIAL, buf)
+        flags = struct.unpack_from("i", buf, 16)[0]
+        struct.pack_into("i", buf, 16, flags | ASYNC_LOW_LATENCY)
+        fcntl.ioctl(conn.fileno(), TIOCSSERIAL, buf)
+    except OSError:
+        pass  # not every driver supports it (CDC-ACM, ptys)
+
+
+def multi_frame(positions):
+    """Build one encoded MULTI frame from (joint_index, angle) pairs."""
+    return b"MULTI:%s\n" % b",".join(_J_PREFIX[idx] + b"%d" % angle for idx, angle in positions)
+
+
+def _format_log_entry(stamp, prefix, message):
+    if isinstance(message, bytes):
+        message = message.decode("utf-8", "replace")
+    return f"[{_strftime(LOG_TIME_FORMAT, stamp)}] {prefix}{message}"
+
+
+def parse_frame(data):
+    """Classify a raw serial line into a (kind, data, value) tuple.
+
+    Only values that are shown as text are decoded; the line itself stays
+    bytes until it is logged.
+    """
+    if data.startswith(b"OK:"):
+        return "ok", data, _parse_positions(data)
+    if data.startswith(b"SEQUENCE:"):
+        return "sequence", data, None
+    if data.startswith(b"ERROR:"):
+        return "error", data, data[6:].decode("utf-8", "replace")
+    if _is_sequence_entry(data):
+        return "sequence_entry", data, data.decode("utf-8", "replace")
+    return "raw", data, None
 
 
 class SerialWorker(QThread):
-    data_received = pyqtSignal(str)
+    frame_received = pyqtSignal(object)
     connection_lost = pyqtSignal()
 
     def __init__(self, port, baudrate=115200):
@@ -42,49 +152,107 @@ class SerialWorker(QThread):
         self.port = port
         self.baudrate = baudrate
         self.serial_conn = None
-        self.running = False
+        # Set up front so a stop() that lands before the port opens still sticks
+        self.running = True
+        self._rxbuf = bytearray()
+        self._tx_queue = queue.SimpleQueue()
+        # Guards the port's open/close state against cancel_read() from the GUI
+        self._port_mutex = QMutex()
 
     def run(self):
         try:
-            self.serial_conn = serial.Serial(self.port, self.baudrate, timeout=1)
-            self.running = True
+            # The thread sleeps in the OS until bytes arrive, or until stop()
+            # or send_bytes() cancels the pending read.
+            self.serial_conn = serial.Serial(
+                self.port, self.baudrate, timeout=SERIAL_READ_TIMEOUT_S
+            )
+            _set_low_latency(self.serial_conn)
             while self.running:
                 try:
-                    if self.serial_conn.in_waiting:
-                        data = self.serial_conn.readline().decode("utf-8").strip()
+                    self._drain_tx()
+                    # Block for the first byte, then drain whatever else is queued
+                    chunk = self.serial_conn.read(1)
+                    if not chunk:
+                        continue
+                    waiting = self.serial_conn.in_waiting
+                    if waiting:
+                        chunk += self.serial_conn.read(waiting)
+                    self._rxbuf += chunk
+                    if b"\n" not in chunk:
+                        # Partial frame; drop it if the link is only sending noise
+                        if len(self._rxbuf) > SERIAL_RX_BUFFER_LIMIT:
+                            self._rxbuf.clear()
+                        continue
+                    *frames, rest = self._rxbuf.split(b"\n")
+                    self._rxbuf = rest
+                    for frame in frames:
+                        data = bytes(frame.strip())
                         if data:
-                            self.data_received.emit(data)
-                    time.sleep(0.01)
+                            self.frame_received.emit(parse_frame(data))
                 except (serial.SerialException, OSError):
                     self.connection_lost.emit()
                     break
         except Exception as e:
             self.connection_lost.emit()
+        finally:
+            self._close()
 
     def stop(self):
+        # Wake the blocked read and let run() close the port; closing it from
+        # here would make that read fail and look like a lost link.
         self.running = False
-        try:
+        with QMutexLocker(self._port_mutex):
             if self.serial_conn and self.serial_conn.is_open:
-                self.serial_conn.close()
-        except Exception:
-            pass
+                self.serial_conn.cancel_read()
+
+    def _close(self):
+        self.running = False
+        with QMutexLocker(self._port_mutex):
+            try:
+                if self.serial_conn and self.serial_conn.is_open:
+                    self.serial_conn.close()
+            except Exception:
+                pass
 
     def send_command(self, command):
-        if not self.serial_conn or not self.serial_conn.is_open:
-            return False
-        try:
-            self.serial_conn.write(f"{command}\n".encode())
+        return self.send_bytes(f"{command}\n".encode())
+
+    def send_bytes(self, payload):
+        # Only the worker thread touches the port for I/O: queue the frame and
+        # wake its read so run() writes it. Write errors surface there as
+        # connection_lost.
+        with QMutexLocker(self._port_mutex):
+            if not self.is_connected:
+                return False
+            self._tx_queue.put(payload)
+            self.serial_conn.cancel_read()
+        return True
+
+    def _drain_tx(self):
+        frames = []
+        while True:
+            try:
+                frames.append(self._tx_queue.get_nowait())
+            except queue.Empty:
+                break
+        if frames:
+            self.serial_conn.write(b"".join(frames))
             self.serial_conn.flush()
-            return True
-        except (serial.SerialException, OSError):
-            self.connection_lost.emit()
-            return False
 
     @property
     def is_connected(self):
         return self.serial_conn is not None and self.serial_conn.is_open and self.running
 
 
+class PortScanWorker(QThread):
+    ports_ready = pyqtSignal(list)
+
+    def run(self):
+        self.ports_ready.emit(
+            [(p.device, p.description) for p in serial.tools.list_ports.comports()]
+        )
+
+
 class ArmControlGUI(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -93,11 +261,32 @@ class ArmControlGUI(QMainWindow):
         self.is_recording = False
         self.current_sequence_index = 0
         self._last_connected_port = None
+        self._port_scanner = None
+        # Lines not yet written to the log view; the view keeps the history
+        self._log_pending = deque(maxlen=MAX_LOG_LINES)
+        self._log_timer = QTimer()
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(LOG_FLUSH_MS)
+        self._log_timer.timeout.connect(self._flush_log)
 
         self._pending_joint_commands = {}
-        self._debounce_timer = QTimer()
-        self._debounce_timer.setSingleShot(True)
-        self._debounce_timer.timeout.connect(self._flush_joint_commands)
+        self._last_sent_joint_values = {}
+        self._slider_send_timer = QTimer()
+        self._slider_send_timer.setSingleShot(True)
+        self._slider_send_timer.timeout.connect(self._flush_joint_commands)
+        self._awaiting_move_reply = False
+        # Speed last applied with SET_SPEED; the spinbox may hold an unsent value
+        self._move_speed_ms = DEFAULT_MOVE_SPEED_MS
+        self._move_reply_timer = QTimer()
+        self._move_reply_timer.setSingleShot(True)
+        self._move_reply_timer.timeout.connect(self._on_move_reply)
+
+        self._sequence_batch = []
+        self._frame_handlers = {
+            "ok": self._handle_ok,
+            "error": self._handle_error,
+            "sequence_entry": self._handle_sequence_entry,
+        }
 
         self._init_ui()
         self._init_shortcuts()
@@ -120,15 +309,11 @@ class ArmControlGUI(QMainWindow):
 
     def _init_shortcuts(self):
         QShortcut(QKeySequence("Escape"), self, self.emergency_stop)
-        QShortcut(QKeySequence("Ctrl+H"), self, lambda: self._send_preset("HOME"))
+        QShortcut(QKeySequence("Ctrl+H"), self, partial(self._send_preset, "HOME"))
         QShortcut(QKeySequence("Ctrl+R"), self, self.toggle_recording)
         QShortcut(QKeySequence("Ctrl+Shift+C"), self, self.toggle_connection)
 
     def _init_timers(self):
-        self._status_timer = QTimer()
-        self._status_timer.timeout.connect(self.request_status)
-        self._status_timer.start(STATUS_POLL_MS)
-
         self._reconnect_timer = QTimer()
         self._reconnect_timer.timeout.connect(self._check_reconnect)
 
@@ -138,12 +323,13 @@ class ArmControlGUI(QMainWindow):
 
         self.joint_sliders = []
         self.joint_value_labels = []
+        name_font = QFont("Arial", 10, QFont.Weight.Bold)
 
         for i, name in enumerate(JOINT_NAMES):
             joint_layout = QVBoxLayout()
 
             label = QLabel(name)
-            label.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+            label.setFont(name_font)
             joint_layout.addWidget(label)
 
             slider_row = QHBoxLayout()
@@ -158,7 +344,8 @@ class ArmControlGUI(QMainWindow):
             slider.setValue(self.current_positions[i])
             slider.setTickPosition(QSlider.TickPosition.TicksBelow)
             slider.setTickInterval(30)
-            slider.valueChanged.connect(lambda val, idx=i: self._on_slider_changed(idx, val))
+            slider.setProperty("joint_index", i)
+            slider.valueChanged.connect(self._on_slider_changed)
             slider_row.addWidget(slider)
 
             value_label = QLabel(f"{self.current_positions[i]}\u00b0")
@@ -174,10 +361,7 @@ class ArmControlGUI(QMainWindow):
             joint_layout.addLayout(slider_row)
 
             if i < NUM_JOINTS - 1:
-                sep = QFrame()
-                sep.setFrameShape(QFrame.Shape.HLine)
-                sep.setFrameShadow(QFrame.Shadow.Sunken)
-                joint_layout.addWidget(sep)
+                joint_layout.addWidget(self._separator())
 
             layout.addLayout(joint_layout)
             self.joint_sliders.append(slider)
@@ -185,6 +369,13 @@ class ArmControlGUI(QMainWindow):
 
         return group
 
+    @staticmethod
+    def _separator():
+        sep = QFrame()
+        sep.setFrameShape(QFrame.Shape.HLine)
+        sep.setFrameShadow(QFrame.Shadow.Sunken)
+        return sep
+
     def _build_right_panel(self):
         panel = QWidget()
         layout = QVBoxLayout(panel)
@@ -213,7 +404,7 @@ class ArmControlGUI(QMainWindow):
         speed_layout.addWidget(QLabel("Delay:"))
         self.speed_spinbox = QSpinBox()
         self.speed_spinbox.setRange(5, 200)
-        self.speed_spinbox.setValue(15)
+        self.speed_spinbox.setValue(DEFAULT_MOVE_SPEED_MS)
         self.speed_spinbox.setSuffix(" ms")
         speed_layout.addWidget(self.speed_spinbox)
         set_speed_btn = QPushButton("Set")
@@ -224,10 +415,10 @@ class ArmControlGUI(QMainWindow):
         # Presets
         preset_group = QGroupBox("Presets  [Ctrl+H = Home]")
         preset_layout = QGridLayout(preset_group)
-        presets = [("Home", "HOME"), ("Min", "MIN"), ("Max", "MAX"), ("Wave", "WAVE")]
-        for idx, (name, cmd) in enumerate(presets):
+        for idx, (name, cmd) in enumerate(PRESETS):
             btn = QPushButton(name)
-            btn.clicked.connect(lambda _, c=cmd: self._send_preset(c))
+            btn.setProperty("preset_cmd", cmd)
+            btn.clicked.connect(self._on_preset_clicked)
             preset_layout.addWidget(btn, idx // 2, idx % 2)
         layout.addWidget(preset_group)
 
@@ -275,9 +466,7 @@ class ArmControlGUI(QMainWindow):
         safety_group = QGroupBox("Safety  [Esc = Stop]")
         safety_layout = QVBoxLayout(safety_group)
         self.emergency_btn = QPushButton("EMERGENCY STOP")
-        self.emergency_btn.setStyleSheet(
-            "QPushButton { background-color: #c0392b; color: white; font-weight: bold; font-size: 13px; padding: 6px; }"
-        )
+        self.emergency_btn.setStyleSheet(EMERGENCY_STYLE)
         self.emergency_btn.clicked.connect(self.emergency_stop)
         safety_layout.addWidget(self.emergency_btn)
         status_btn = QPushButton("Get Status")
@@ -288,9 +477,12 @@ class ArmControlGUI(QMainWindow):
         # Log
         log_group = QGroupBox("Log")
         log_layout = QVBoxLayout(log_group)
-        self.status_text = QTextEdit()
+        self.status_text = QPlainTextEdit()
         self.status_text.setMaximumHeight(150)
         self.status_text.setReadOnly(True)
+        self.status_text.setMaximumBlockCount(MAX_LOG_LINES)
+        self.status_text.installEventFilter(self)
+        self.status_text.verticalScrollBar().sliderReleased.connect(self._flush_log)
         log_layout.addWidget(self.status_text)
         layout.addWidget(log_group)
 
@@ -312,14 +504,17 @@ class ArmControlGUI(QMainWindow):
         port = port_text.split(" - ")[0]
         try:
             self.serial_worker = SerialWorker(port)
-            self.serial_worker.data_received.connect(self._on_data_received)
-            self.serial_worker.connection_lost.connect(self._on_connection_lost)
+            # Both signals are only ever emitted from the worker thread
+            queued = Qt.ConnectionType.QueuedConnection
+            self.serial_worker.frame_received.connect(self._on_frame_received, queued)
+            self.serial_worker.connection_lost.connect(self._on_connection_lost, queued)
             self.serial_worker.start()
             self._last_connected_port = port
             self.connect_btn.setText("Disconnect")
             self.statusBar().showMessage(f"Connected to {port}")
             self._log(f"Connected to {port}")
             self._reconnect_timer.stop()
+            QTimer.singleShot(500, self._auto_status)
             QTimer.singleShot(500, self._refresh_sequences)
         except Exception as e:
             QMessageBox.critical(self, "Connection Error", str(e))
@@ -329,13 +524,25 @@ class ArmControlGUI(QMainWindow):
             self.serial_worker.stop()
             self.serial_worker.wait(2000)
             self.serial_worker = None
+        self._reset_move_state()
+        # Reopening the port auto-resets most Arduinos, dropping an unfinished
+        # recording; don't carry it over to the next connection.
+        self._reset_recording_state()
         self.connect_btn.setText("Connect")
         self.statusBar().showMessage("Disconnected")
         self._log("Disconnected")
 
     def _on_connection_lost(self):
+        worker = self.sender()
+        if worker is not self.serial_worker:
+            return  # queued from a worker that has already been replaced
+        # Join the thread before dropping the last reference to it.
+        worker.stop()
+        worker.wait(2000)
         self._log("Connection lost - will attempt reconnect")
         self.serial_worker = None
+        self._reset_move_state()
+        self._reset_recording_state()
         self.connect_btn.setText("Connect")
         self.statusBar().showMessage("Connection lost")
         self._reconnect_timer.start(RECONNECT_CHECK_MS)
@@ -343,103 +550,206 @@ class ArmControlGUI(QMainWindow):
     def _check_reconnect(self):
         if self._last_connected_port is None:
             return
-        ports = [p.device for p in serial.tools.list_ports.comports()]
-        if self._last_connected_port in ports:
-            self._log(f"Port {self._last_connected_port} reappeared, reconnecting...")
-            self._reconnect_timer.stop()
-            for i in range(self.port_combo.count()):
-                if self.port_combo.itemText(i).startswith(self._last_connected_port):
-                    self.port_combo.setCurrentIndex(i)
-                    break
-            self._connect()
+        self._refresh_ports()
+
+    def _reconnect_if_port_back(self, ports):
+        if self._last_connected_port not in [device for device, _ in ports]:
+            return
+        self._log(f"Port {self._last_connected_port} reappeared, reconnecting...")
+        self._reconnect_timer.stop()
+        for i in range(self.port_combo.count()):
+            if self.port_combo.itemText(i).startswith(self._last_connected_port):
+                self.port_combo.setCurrentIndex(i)
+                break
+        self._connect()
 
     def _refresh_ports(self):
-        self.port_combo.clear()
-        for p in serial.tools.list_ports.comports():
-            self.port_combo.addItem(f"{p.device} - {p.description}")
+        # comports() walks sysfs/udev (SetupAPI on Windows); keep it off the GUI thread
+        if self._port_scanner is not None and self._port_scanner.isRunning():
+            return
+        self._port_scanner = PortScanWorker()
+        self._port_scanner.ports_ready.connect(
+            self._on_ports_scanned, Qt.ConnectionType.QueuedConnection
+        )
+        self._port_scanner.start()
+
+    def _on_ports_scanned(self, ports):
+        self._populate_ports(ports)
+        if self._reconnect_timer.isActive():
+            self._reconnect_if_port_back(ports)
+
+    def _populate_ports(self, ports):
+        items = [f"{device} - {description}" for device, description in ports]
+        combo = self.port_combo
+        # The reconnect check rescans every few seconds; leave the list (and
+        # the user's pick) alone unless the devices actually changed.
+        if items == [combo.itemText(i) for i in range(combo.count())]:
+            return
+        current = combo.currentText()
+        combo.clear()
+        combo.addItems(items)
+        idx = combo.findText(current)
+        if idx >= 0:
+            combo.setCurrentIndex(idx)
 
     # ---- Send Helper ----
 
-    def _send(self, command, silent=False):
+    def _ready_to_send(self, silent=False):
         if not self.serial_worker or not self.serial_worker.is_connected:
             if not silent:
                 self.statusBar().showMessage("Not connected")
             return False
-        return self.serial_worker.send_command(command)
+        # Any other command may move the arm, so forget what the sliders sent
+        self._last_sent_joint_values.clear()
+        return True
+
+    def _send(self, command, silent=False):
+        return self._ready_to_send(silent) and self.serial_worker.send_command(command)
 
-    # ---- Slider Debouncing ----
+    def _send_bytes(self, payload, silent=False):
+        return self._ready_to_send(silent) and self.serial_worker.send_bytes(payload)
 
-    def _on_slider_changed(self, joint_index, value):
+    # ---- Slider Coalescing ----
+
+    @pyqtSlot(int)
+    def _on_slider_changed(self, value):
+        joint_index = self.sender().property("joint_index")
         self.joint_value_labels[joint_index].setText(f"{value}\u00b0")
         self._pending_joint_commands[joint_index] = value
-        self._debounce_timer.start(SLIDER_DEBOUNCE_MS)
+        # Don't restart a running timer: a continuous drag still goes out at
+        # most once per interval instead of waiting for the slider to settle.
+        if not self._slider_send_timer.isActive():
+            self._slider_send_timer.start(SLIDER_SEND_INTERVAL_MS)
 
     def _flush_joint_commands(self):
         if not self.serial_worker or not self.serial_worker.is_connected:
-            self._pending_joint_commands.clear()
+            self._pending_joint_commands = {}
+            self._awaiting_move_reply = False
+            return
+        # The Arduino can't read while a servo is stepping, so keep at most one
+        # slider frame in flight; later values wait here and collapse.
+        if self._awaiting_move_reply:
             return
-        for idx, val in self._pending_joint_commands.items():
-            self._send(f"J{idx + 1}:{val}", silent=True)
-        self._pending_joint_commands.clear()
+        pending = self._pending_joint_commands
+        self._pending_joint_commands = {}
+        changed = {
+            idx: val for idx, val in pending.items()
+            if self._last_sent_joint_values.get(idx) != val
+        }
+        if changed and self.serial_worker.send_bytes(multi_frame(changed.items())):
+            self._last_sent_joint_values.update(changed)
+            self._awaiting_move_reply = True
+            self._move_reply_timer.start(self._move_duration_ms(changed) + SLIDER_REPLY_MARGIN_MS)
+
+    def _move_duration_ms(self, targets):
+        # The firmware steps one degree per speed delay, one joint after another
+        current = self.current_positions
+        degrees = sum(abs(angle - current[idx]) for idx, angle in targets.items())
+        return degrees * self._move_speed_ms
+
+    def _reset_move_state(self):
+        # A reply to a frame sent on a dropped link will never come
+        self._slider_send_timer.stop()
+        self._move_reply_timer.stop()
+        self._awaiting_move_reply = False
+        self._pending_joint_commands = {}
+        self._last_sent_joint_values = {}
+
+    def _on_move_reply(self):
+        self._move_reply_timer.stop()
+        self._awaiting_move_reply = False
+        if self._pending_joint_commands and not self._slider_send_timer.isActive():
+            self._slider_send_timer.start(SLIDER_SEND_INTERVAL_MS)
 
     # ---- Commands ----
 
+    @pyqtSlot()
+    def _on_preset_clicked(self):
+        self._send_preset(self.sender().property("preset_cmd"))
+
     def _send_preset(self, cmd):
-        if self._send(cmd):
+        frame = PRESET_FRAMES.get(cmd)
+        sent = self._send_bytes(frame) if frame else self._send(cmd)
+        if sent:
             self._log(f"Sent: {cmd}")
 
     def _set_speed(self):
         speed = self.speed_spinbox.value()
         if self._send(f"SET_SPEED:{speed}"):
+            self._move_speed_ms = speed
             self._log(f"Speed set to {speed}ms")
 
     def emergency_stop(self):
         if self._send("STOP"):
             self._log("EMERGENCY STOP")
-        orig = self.emergency_btn.styleSheet()
-        self.emergency_btn.setStyleSheet(
-            "QPushButton { background-color: #7b241c; color: white; font-weight: bold; font-size: 13px; padding: 6px; }"
-        )
-        QTimer.singleShot(1500, lambda: self.emergency_btn.setStyleSheet(orig))
+        self.emergency_btn.setStyleSheet(EMERGENCY_ACTIVE_STYLE)
+        QTimer.singleShot(EMERGENCY_FLASH_MS, self._reset_emergency_style)
+
+    def _reset_emergency_style(self):
+        self.emergency_btn.setStyleSheet(EMERGENCY_STYLE)
 
     def request_status(self):
         self._send("STATUS", silent=True)
 
-    # ---- Data Handling ----
-
-    def _on_data_received(self, data):
-        self._log(f"RX: {data}")
-
-        if data.startswith("OK:"):
-            self._parse_positions(data[3:])
-        elif data.startswith("SEQUENCE:"):
-            pass
-        elif data.startswith("ERROR:"):
-            self.statusBar().showMessage(f"Error: {data[6:]}")
-        elif self._is_sequence_entry(data):
-            self.sequence_list.addItem(data)
+    def _auto_status(self):
+        # Every move is answered with an OK: frame, so while slider moves are
+        # queued or being recorded an unrequested STATUS would only wait
+        # behind them.
+        if self.is_recording or self._awaiting_move_reply or self._pending_joint_commands:
+            return
+        self.request_status()
 
-    @staticmethod
-    def _is_sequence_entry(data):
-        parts = data.split(":", 1)
-        return len(parts) == 2 and parts[0].isdigit() and len(parts[1]) > 0
+    # ---- Data Handling ----
 
-    def _parse_positions(self, payload):
-        try:
-            for pair in payload.split(","):
-                if ":" not in pair:
-                    continue
-                joint_part, angle_str = pair.split(":")
-                idx = int(joint_part[1:]) - 1
-                angle = int(angle_str)
-                if 0 <= idx < NUM_JOINTS:
-                    self.current_positions[idx] = angle
-                    self.joint_sliders[idx].blockSignals(True)
-                    self.joint_sliders[idx].setValue(angle)
-                    self.joint_sliders[idx].blockSignals(False)
-                    self.joint_value_labels[idx].setText(f"{angle}\u00b0")
-        except (ValueError, IndexError):
-            pass
+    def _on_frame_received(self, frame):
+        kind, data, value = frame
+        self._log(data, prefix="RX: ")
+        handler = self._frame_handlers.get(kind)
+        if handler:
+            handler(value)
+
+    def _handle_ok(self, positions):
+        self._apply_positions(positions)
+        # Only a move reply carries positions; "OK:Speed set" and the like
+        # don't answer the slider frame in flight.
+        if positions and self._awaiting_move_reply:
+            self._on_move_reply()
+
+    def _handle_error(self, message):
+        self.statusBar().showMessage(f"Error: {message}")
+        if self._awaiting_move_reply:
+            self._on_move_reply()
+
+    def _handle_sequence_entry(self, entry):
+        # A listing arrives as one frame per sequence; add them to the view
+        # in one go once the queued frames have been handled.
+        if not self._sequence_batch:
+            QTimer.singleShot(0, self._flush_sequence_batch)
+        self._sequence_batch.append(entry)
+
+    def _flush_sequence_batch(self):
+        items, self._sequence_batch = self._sequence_batch, []
+        self.sequence_list.setUpdatesEnabled(False)
+        self.sequence_list.addItems(items)
+        self.sequence_list.setUpdatesEnabled(True)
+
+    def _apply_positions(self, positions):
+        current = self.current_positions
+        changed = [(idx, angle) for idx, angle in positions if current[idx] != angle]
+        if not changed:
+            return
+        sliders, labels = self.joint_sliders, self.joint_value_labels
+        pending = self._pending_joint_commands
+        for idx, angle in changed:
+            current[idx] = angle
+            slider = sliders[idx]
+            # Usually the echo of a slider move, so the widgets already agree;
+            # and don't pull the handle out from under an ongoing drag.
+            if slider.value() == angle or slider.isSliderDown() or idx in pending:
+                continue
+            with QSignalBlocker(slider):
+                slider.setValue(angle)
+            labels[idx].setText(f"{angle}\u00b0")
 
     # ---- Sequences ----
 
@@ -468,12 +778,15 @@ class ArmControlGUI(QMainWindow):
                 self._log(f"Recording to slot {idx}: {name}")
         else:
             if self._send("RECORD_STOP"):
-                self.is_recording = False
-                self.record_btn.setText("Start Recording")
-                self.record_btn.setStyleSheet("QPushButton { background-color: #e67e22; color: white; }")
+                self._reset_recording_state()
                 self._log("Recording stopped")
                 self._refresh_sequences()
 
+    def _reset_recording_state(self):
+        self.is_recording = False
+        self.record_btn.setText("Start Recording")
+        self.record_btn.setStyleSheet("QPushButton { background-color: #e67e22; color: white; }")
+
     def _next_sequence_slot(self):
         used = set()
         for i in range(self.sequence_list.count()):
@@ -540,36 +853,59 @@ class ArmControlGUI(QMainWindow):
         try:
             with open(path, "r") as f:
                 data = json.load(f)
+            if not isinstance(data, dict):
+                raise ValueError("Expected a JSON object")
 
             if "speed_ms" in data:
                 self.speed_spinbox.setValue(data["speed_ms"])
 
-            all_sent = True
-            if "positions" in data:
-                for key, angle in data["positions"].items():
-                    if not self._send(f"{key}:{angle}"):
-                        all_sent = False
-                        break
-                    time.sleep(0.05)
-
-            if all_sent:
+            sent = True
+            positions = _file_positions(data["positions"]) if "positions" in data else []
+            if positions:
+                targets = []
+                for idx, angle in positions:
+                    target = clamp_angle(idx, angle)
+                    if target != angle:
+                        self._log(f"J{idx + 1}={angle} is out of range, clamped to {target}")
+                    targets.append((idx, target))
+                sent = self._send_bytes(multi_frame(targets))
+
+            if sent:
                 self._log(f"Loaded from {path}")
             else:
-                self._log(f"Partial load from {path} (connection lost)")
-        except (OSError, json.JSONDecodeError, KeyError) as e:
+                self._log(f"Load from {path} not sent (not connected)")
+        except (OSError, ValueError, KeyError, TypeError) as e:
             QMessageBox.critical(self, "Error", str(e))
 
     # ---- Logging ----
 
-    def _log(self, message):
-        ts = time.strftime("%H:%M:%S")
-        self.status_text.append(f"[{ts}] {message}")
-        doc = self.status_text.document()
-        while doc.blockCount() > MAX_LOG_LINES:
-            cursor = QTextCursor(doc.begin())
-            cursor.select(QTextCursor.SelectionType.BlockUnderCursor)
-            cursor.movePosition(QTextCursor.MoveOperation.NextBlock, QTextCursor.MoveMode.KeepAnchor)
-            cursor.removeSelectedText()
+    def _log(self, message, prefix=""):
+        # Only the time is captured here; the line (and a bytes message's
+        # decode) is formatted when it is flushed, so lines pushed out of the
+        # deque unseen cost nothing more.
+        self._log_pending.append((_localtime(), prefix, message))
+        # Bursts of lines are painted together, at most every LOG_FLUSH_MS
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self):
+        if not self._log_pending:
+            return
+        # Don't lay out text nobody can see, or yank a scrollbar being dragged;
+        # showing the log or releasing the scrollbar flushes it again.
+        bar = self.status_text.verticalScrollBar()
+        if not self.status_text.isVisible() or bar.isSliderDown():
+            return
+        lines = [_format_log_entry(*entry) for entry in self._log_pending]
+        self._log_pending.clear()
+        # One append per burst; it only follows the end if the view was
+        # already there, keeps any selection, and the block limit trims.
+        self.status_text.appendPlainText("\n".join(lines))
+
+    def eventFilter(self, obj, event):
+        if obj is self.status_text and event.type() == QEvent.Type.Show:
+            self._flush_log()
+        return super().eventFilter(obj, event)
 
     # ---- Cleanup ----
 
@@ -577,6 +913,8 @@ class ArmControlGUI(QMainWindow):
         if self.serial_worker:
             self.serial_worker.stop()
             self.serial_worker.wait(2000)
+        if self._port_scanner:
+            self._port_scanner.wait(2000)
         event.accept()
 
 
@@ -6,6 +6,7 @@
  * Serial Protocol:
  * Commands:
  *   J1:90 .. J6:152  - Set joint angle (validated against limits)
+ *   MULTI:J1=90,J2=45 - Set several joints in one frame (all validated first)
  *   HOME              - Go to home position
  *   MIN / MAX         - Move all joints to min/max limits
  *   WAVE              - Perform wave gesture
@@ -182,6 +183,8 @@ void processCommand(String command) {
 
   if (command.startsWith(CMD_JOINT_PREFIX)) {
     processJointCommand(command);
+  } else if (command.startsWith(CMD_MULTI)) {
+    processMultiCommand(command);
   } else if (command == CMD_HOME) {
     moveToPositions(HOME_POSITIONS, 200);
     sendStatus();
@@ -222,41 +225,50 @@ void processCommand(String command) {
   }
 }
 
-void processJointCommand(String command) {
-  int colonIndex = command.indexOf(':');
-  if (colonIndex < 2) {
-    Serial.println(F("ERROR:Invalid format. Use J1:90"));
-    return;
-  }
-
-  int jointNum = command.substring(1, colonIndex).toInt();
+// Validates one joint/angle pair, printing the error response on failure.
+boolean validateJointTarget(int jointNum, String angleStr, int* jointIndex, int* targetAngle) {
   if (jointNum < 1 || jointNum > NUM_JOINTS) {
     Serial.println(F("ERROR:Joint must be 1-6"));
-    return;
+    return false;
   }
 
-  String angleStr = command.substring(colonIndex + 1);
   if (angleStr.length() == 0) {
     Serial.println(F("ERROR:Missing angle"));
-    return;
+    return false;
   }
   for (unsigned int i = 0; i < angleStr.length(); i++) {
     if (!isDigit(angleStr.charAt(i))) {
       Serial.println(F("ERROR:Angle must be numeric"));
-      return;
+      return false;
     }
   }
 
-  int jointIndex = jointNum - 1;
-  int targetAngle = angleStr.toInt();
+  *jointIndex = jointNum - 1;
+  *targetAngle = angleStr.toInt();
 
-  if (targetAngle < JOINT_MIN[jointIndex] || targetAngle > JOINT_MAX[jointIndex]) {
+  if (*targetAngle < JOINT_MIN[*jointIndex] || *targetAngle > JOINT_MAX[*jointIndex]) {
     Serial.print(F("ERROR:Joint "));
     Serial.print(jointNum);
     Serial.print(F(" range is "));
-    Serial.print(JOINT_MIN[jointIndex]);
+    Serial.print(JOINT_MIN[*jointIndex]);
     Serial.print('-');
-    Serial.println(JOINT_MAX[jointIndex]);
+    Serial.println(JOINT_MAX[*jointIndex]);
+    return false;
+  }
+  return true;
+}
+
+void processJointCommand(String command) {
+  int colonIndex = command.indexOf(':');
+  if (colonIndex < 2) {
+    Serial.println(F("ERROR:Invalid format. Use J1:90"));
+    return;
+  }
+
+  int jointIndex, targetAngle;
+  if (!validateJointTarget(command.substring(1, colonIndex).toInt(),
+                           command.substring(colonIndex + 1),
+                           &jointIndex, &targetAngle)) {
     return;
   }
 
@@ -269,6 +281,52 @@ void processJointCommand(String command) {
   sendStatus();
 }
 
+void processMultiCommand(String command) {
+  int colonIndex = command.indexOf(':');
+  if (colonIndex == -1 || colonIndex == (int)command.length() - 1) {
+    Serial.println(F("ERROR:Use MULTI:J1=90,J2=45"));
+    return;
+  }
+
+  int targets[NUM_JOINTS];
+  boolean selected[NUM_JOINTS];
+  for (int i = 0; i < NUM_JOINTS; i++) selected[i] = false;
+
+  // Validate every pair before moving anything
+  int start = colonIndex + 1;
+  while (start < (int)command.length()) {
+    int comma = command.indexOf(',', start);
+    if (comma == -1) comma = command.length();
+    String pair = command.substring(start, comma);
+    int eqIndex = pair.indexOf('=');
+    if (!pair.startsWith(CMD_JOINT_PREFIX) || eqIndex < 2) {
+      Serial.println(F("ERROR:Invalid format. Use MULTI:J1=90,J2=45"));
+      return;
+    }
+
+    int jointIndex, targetAngle;
+    if (!validateJointTarget(pair.substring(1, eqIndex).toInt(),
+                             pair.substring(eqIndex + 1),
+                             &jointIndex, &targetAngle)) {
+      return;
+    }
+    targets[jointIndex] = targetAngle;
+    selected[jointIndex] = true;
+    start = comma + 1;
+  }
+
+  for (int i = 0; i < NUM_JOINTS && !emergencyStop; i++) {
+    if (selected[i]) moveServo(i, targets[i]);
+  }
+
+  // One waypoint per frame, not one per joint
+  if (isRecording && currentRecordingSequence >= 0) {
+    addSequencePoint(currentRecordingSequence, moveSpeed);
+  }
+
+  sendStatus();
+}
+
 void processSetSpeedCommand(String command) {
   int colonIndex = command.indexOf(':');
   if (colonIndex == -1) {
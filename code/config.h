@@ -62,6 +62,9 @@ const int HOME_POSITIONS[NUM_JOINTS] = {92, 85, 45, 108, 80, 152};
 // Joint command prefix
 #define CMD_JOINT_PREFIX "J"
 
+// Multi-joint command prefix (MULTI:J1=90,J2=45)
+#define CMD_MULTI "MULTI"
+
 // Response prefixes
 #define RESP_OK "OK:"
 #define RESP_ERROR "ERROR:"